@@ -4,7 +4,7 @@ Also, a function for finding a common ancestor of an iterable of types.
 
 import enum
 import functools
-from typing import Optional, List, NamedTuple
+from typing import Optional, List
 
 
 class CollectionType:
@@ -20,50 +20,47 @@ class Unknown:
 
 
 def nearest_common_ancestor(types: List[type]) -> Optional[type]:
-    return functools.reduce(_nearest_ancestor_for_pair, types)
+    # Dedupe (preserving order), so repeated types don't re-enter the reduce.
+    return functools.reduce(nearest_ancestor_for_pair, dict.fromkeys(types))
 
 
-# ----------------
-# private
-
-
-_TOO_COMMON_BASES = frozenset([None, type(None), enum.Enum, object, CollectionType])
+def nearest_ancestor_for_pair(type_a: type, type_b: type) -> Optional[type]:
+    """Memoizing front for '_ancestor_for_pair'.
 
+    The ancestor relation doesn't care about argument order, so
+    normalize the pair first: both (a, b) and (b, a) share one cache
+    slot.
+    """
+    if id(type_a) > id(type_b):
+        type_a, type_b = type_b, type_a
+    return _ancestor_for_pair(type_a, type_b)
 
-class Node(NamedTuple):
-    cls: type
-    distance: int  # distance traveled up the hierarchy to get there
 
+def cache_clear() -> None:
+    """Forget all memoized ancestor-pair results."""
+    _ancestor_for_pair.cache_clear()
 
-def _nearest_ancestor_for_pair(type_a: type, type_b: type) -> Optional[type]:
-    """Traverse upwards in the class hierarchy to find the nearest common ancestor."""
 
-    def go(a: Node, b: Node) -> Optional[Node]:
+# ----------------
+# private
 
-        if {a.cls, b.cls} & _TOO_COMMON_BASES:
-            return None
 
-        # they're the same class
-        if a.cls == b.cls:
-            return min([a, b], key=lambda node: node.distance)
+_TOO_COMMON_BASES = frozenset([None, type(None), enum.Enum, object, CollectionType])
 
-        # one class is a parent of the other
-        if a.cls in b.cls.__bases__:
-            return a
-        if b.cls in a.cls.__bases__:
-            return b
 
-        # traverse up the hierarchy tree
-        b_ancestors = [go(a, Node(p, b.distance + 1)) for p in b.cls.__bases__]
-        a_ancestors = [go(b, Node(p, a.distance + 1)) for p in a.cls.__bases__]
-        common_nodes = [
-            node for node in a_ancestors + b_ancestors if node is not None
-        ]
+@functools.lru_cache(maxsize=4096)
+def _ancestor_for_pair(type_a: type, type_b: type) -> Optional[type]:
+    """Find the nearest common ancestor of a pair of types.
 
-        if not common_nodes:
-            return None
-        else:
-            return min(common_nodes, key=lambda node: node.distance)
+    CPython caches '__mro__' on the type, so rather than walk
+    '__bases__' ourselves, we just take the first class in type_a's MRO
+    which also appears in type_b's (nearness is implicit in MRO order).
+    """
+    if type_a in _TOO_COMMON_BASES or type_b in _TOO_COMMON_BASES:
+        return None
 
-    res = go(Node(type_a, 0), Node(type_b, 0))
-    return res.cls if res else None
+    b_mro = set(type_b.__mro__)
+    for cls in type_a.__mro__:
+        if cls in b_mro and cls not in _TOO_COMMON_BASES:
+            return cls
+    return None
@@ -4,6 +4,7 @@ objects.
 """
 
 import collections
+import itertools
 from typing import Tuple, Iterable
 import numpy as np
 from Groq.quid.composition import mangler
@@ -14,6 +15,21 @@ _FLAT_COL_TYPES = (list, np.ndarray, set, frozenset)
 _ASSOC_COL_TYPES = (dict, collections.defaultdict)
 COLLECTION_TYPES = (tuple,) + _FLAT_COL_TYPES + _ASSOC_COL_TYPES
 
+# For the hot exact-type check: one hash, vs. isinstance's C-level walk
+# over a 7-tuple. (isinstance remains the fallback for subclasses.)
+COLLECTION_TYPE_SET = frozenset(COLLECTION_TYPES)
+
+# dtype 'kind' => the Python type of a boxed element.
+_NP_KIND_TO_TYPE = {
+    "b": bool,
+    "i": int,
+    "u": int,
+    "f": float,
+    "c": complex,
+    "U": str,
+    "S": bytes,
+}
+
 
 class CollectionTypesInternTable:
     """Creates new classes, as necessary, to correspond to collection
@@ -25,11 +41,8 @@ class CollectionTypesInternTable:
     def __init__(self, max_elements: int = None):
         # We store two different kinds of new classes.
         # 1. non-tuple collections / sequences:
-        #       Dict[collection_type, Dict[element_type, new_type]]
-        #    We could make this instead:
         #       Dict[Tuple[collection_type, element_type], new_type]
-        #    In which case, we wouldn't need two different dicts for this.
-        self._non_tuples = collections.defaultdict(dict)
+        self._non_tuples = {}
         # 2. for tuples
         #       Dict[Tuple[element_type, ...], new_type]
         self._tuple_classes = {}
@@ -39,18 +52,18 @@ class CollectionTypesInternTable:
         """Determine the type of the elements of collection 'col'.
         Create a new class to represent collections of that type, if necessary.
         Add to mapping of:
-          { collection_type => { element_type => collection_of_types_type } }
+          { (collection_type, element_type) => collection_of_types_type }
         """
         col_type = type(col)
-        if col_type not in COLLECTION_TYPES:
+        if col_type not in COLLECTION_TYPE_SET:
             raise ValueError(f"Object {col} ({col_type}) not a collection type")
 
-        elem_type = self._element_type(col)
-        if elem_type not in self._non_tuples[col_type]:
-            self._non_tuples[col_type][elem_type] = self.mk_collection_type(
-                col_type, elem_type
-            )
-        return self._non_tuples[col_type][elem_type]
+        key = (col_type, self._element_type(col))
+        new_type = self._non_tuples.get(key)
+        if new_type is None:
+            new_type = self.mk_collection_type(*key)
+            self._non_tuples[key] = new_type
+        return new_type
 
     def mk_collection_type(self, col_type: type, elem_type: type) -> type:
         """Define a new class to represent a type-specific collection.
@@ -58,7 +71,7 @@ class CollectionTypesInternTable:
         """
         class_hint = f"{col_type.__name__}[{_new_class_name(elem_type)}]"
         attrs = {
-            "type_hint": class_hint,  # this isn't quite the final type hint
+            "type_hint": _LAZY_TYPE_HINT,  # this isn't quite the final type hint
             "collection_type": col_type,
             "element_type": elem_type,
         }
@@ -68,7 +81,10 @@ class CollectionTypesInternTable:
         """Attempt to infer the type of the elements of collection 'col'.
         (_How_ we do this depends on self._max_elements.)
         """
-        if isinstance(col, _FLAT_COL_TYPES):
+        if isinstance(col, np.ndarray):
+            return self._ndarray_elem_type(col)
+
+        elif isinstance(col, _FLAT_COL_TYPES):
             return self._flat_collection_elem_type(col)
 
         elif isinstance(col, _ASSOC_COL_TYPES):
@@ -81,6 +97,22 @@ class CollectionTypesInternTable:
             # Don't expect this to happen, as the input arg was already validated.
             raise Exception(f"col should be one of {COLLECTION_TYPES}")
 
+    def _ndarray_elem_type(self, col) -> type:
+        """A primitive-dtype ndarray is homogeneous by construction, so
+        read the element type straight off the dtype instead of boxing
+        (and inspecting) every element.
+        """
+        if len(col) == 0:
+            return ancestor.Unknown
+        # Only for 1-d arrays: the "elements" of an n-d array are
+        # themselves arrays, which the generic path handles.
+        if col.ndim == 1:
+            elem_type = _NP_KIND_TO_TYPE.get(col.dtype.kind)
+            if elem_type is not None:
+                return elem_type
+        # e.g. object dtype: inspect the elements like any flat collection.
+        return self._flat_collection_elem_type(col)
+
     def _flat_collection_elem_type(self, col) -> type:
         """lists and sets are easy to handle. We look at either every
         element or just self._max_elements of them, and attempt to
@@ -100,15 +132,20 @@ class CollectionTypesInternTable:
             else:
                 elems = take(self._max_elements, col)
 
-            # Get a single type.
-            elem_types = list({self._type_of_elem(e) for e in iter(elems)})
-            if not elem_types:
-                elem_type = None
-            else:
-                elem_type = ancestor.nearest_common_ancestor(elem_types)
-                if elem_type is None:
-                    elem_type = elem_types[0]
-            return elem_type
+            # Get a single type: fold the nearest-ancestor-so-far over
+            # the elements, rather than building a set + list first.
+            it = iter(elems)
+            first_type = acc = self._type_of_elem(next(it))
+            for e in it:
+                elem_type = self._type_of_elem(e)
+                if elem_type is acc:
+                    # Same type as the ancestor so far (the common case).
+                    continue
+                acc = ancestor.nearest_ancestor_for_pair(acc, elem_type)
+                if acc is None:
+                    # Irreconcilable; fall back on the first element's type.
+                    return first_type
+            return acc
 
     def _associative_collection_elem_type(self, col) -> type:
         """dicts are essentially composed of 2-tuples. There's a pair of types
@@ -137,29 +174,33 @@ class CollectionTypesInternTable:
             else:
                 pairs = take(self._max_elements, col.items())
 
-            # Get a single type for keys.
-            key_types = list({self._type_of_elem(k) for k, _ in pairs})
-            key_type = ancestor.nearest_common_ancestor(key_types)
-            if key_type is None:
-                key_type = key_types[0]
-
-            # Get a single type for vals.
-            val_types = list({self._type_of_elem(v) for _, v in pairs})
-            val_type = ancestor.nearest_common_ancestor(val_types)
-            if val_type is None:
-                val_type = val_types[0]
+            # Get a single type for keys and a single type for vals,
+            # folding both ancestors in one pass over the items.
+            it = iter(pairs)
+            key, val = next(it)
+            first_key_type = key_acc = self._type_of_elem(key)
+            first_val_type = val_acc = self._type_of_elem(val)
+            for key, val in it:
+                elem_type = self._type_of_elem(key)
+                if elem_type is not key_acc:
+                    key_acc = ancestor.nearest_ancestor_for_pair(key_acc, elem_type)
+                elem_type = self._type_of_elem(val)
+                if elem_type is not val_acc:
+                    val_acc = ancestor.nearest_ancestor_for_pair(val_acc, elem_type)
+
+            # Irreconcilable? Fall back on the first pair's types.
+            key_type = key_acc if key_acc is not None else first_key_type
+            val_type = val_acc if val_acc is not None else first_val_type
 
             # Get or create the composite type and return it.
-            tuple_of_types = (key_type, val_type)
-            if tuple_of_types not in self._tuple_classes:
-                self._tuple_classes[tuple_of_types] = mk_tuple_class(tuple_of_types)
-            return self._tuple_classes[tuple_of_types]
+            return self._intern_tuple_type((key_type, val_type))
 
     def _type_of_elem(self, e: object) -> type:
-        if isinstance(e, COLLECTION_TYPES):
+        elem_type = type(e)
+        if elem_type in COLLECTION_TYPE_SET or isinstance(e, COLLECTION_TYPES):
             return self.collection_type_for(e)
         else:
-            return type(e)
+            return elem_type
 
     # -------------
     # tuple types
@@ -177,21 +218,56 @@ class CollectionTypesInternTable:
             else type(e)
             for e in tpl
         )
-        if tuple_of_types not in self._tuple_classes:
-            self._tuple_classes[tuple_of_types] = mk_tuple_class(tuple_of_types)
-        return self._tuple_classes[tuple_of_types]
+        return self._intern_tuple_type(tuple_of_types)
+
+    def _intern_tuple_type(self, tuple_of_types: Tuple[type, ...]) -> type:
+        """One hash probe on a hit, instead of the 'in'-then-index pair."""
+        new_type = self._tuple_classes.get(tuple_of_types)
+        if new_type is None:
+            new_type = mk_tuple_class(tuple_of_types)
+            self._tuple_classes[tuple_of_types] = new_type
+        return new_type
 
 
 # -----------------------
 # stand-alone functions
 
 
-def take(n: int, xs: Iterable) -> list:
-    """Like xs[:n], but only force the first `n` elements if it's a generator."""
-    if isinstance(xs, list):
+def take(n: int, xs: Iterable) -> Iterable:
+    """Like xs[:n], but only force the first `n` elements if it's a generator.
+
+    Sliceable inputs (list, tuple, ndarray) are sliced at C level; for
+    everything else (generators, dict views), 'islice' avoids the
+    per-element tuple building of a zip(range(n), xs) loop.
+    """
+    if isinstance(xs, (list, tuple, np.ndarray)):
         return xs[:n]
     else:
-        return [x for (_, x) in zip(range(n), xs)]
+        return list(itertools.islice(xs, n))
+
+
+class _LazyTypeHint:
+    """Builds a generated class's 'type_hint' string on first access.
+
+    The hint is only read for display, and many TypeTracker runs never
+    display anything -- so don't store a copy on every generated class.
+    Reconstruct it from the stored types on demand, then cache it by
+    overwriting this descriptor on the class.
+    """
+
+    def __get__(self, obj, cls=None):
+        if cls is None:
+            cls = type(obj)
+        element_types = getattr(cls, "element_types", None)
+        if element_types is not None:
+            hint = _tuple_type_name(element_types)
+        else:
+            hint = f"{cls.collection_type.__name__}[{_new_class_name(cls.element_type)}]"
+        cls.type_hint = hint
+        return hint
+
+
+_LAZY_TYPE_HINT = _LazyTypeHint()
 
 
 def mk_tuple_class(tuple_of_types: Tuple[type, ...]) -> type:
@@ -200,7 +276,7 @@ def mk_tuple_class(tuple_of_types: Tuple[type, ...]) -> type:
     """
     type_hint = _tuple_type_name(tuple_of_types)
     attrs = {
-        "type_hint": type_hint,
+        "type_hint": _LAZY_TYPE_HINT,
         "collection_type": tuple,
         "element_types": tuple_of_types,
     }
@@ -6,9 +6,11 @@ https://graphviz.gitlab.io/_pages/doc/info/lang.html
 https://graphviz.gitlab.io/_pages/doc/info/attrs.html
 """
 
+import collections
+import functools
 from types import ModuleType
 import re
-from typing import List, Callable, Set, Dict
+from typing import List, Callable, Set, Dict, Tuple
 
 from Groq.quid import inheritance, pkg
 
@@ -18,9 +20,19 @@ def hierarchy_diagram_dot(
     group_by_module: bool = True,
     cls_color: Callable[[type], str] = None,
     ranksep: float = 3.0,
+    class_graph: Tuple[Dict, Dict] = None,
 ) -> str:
     """ Create .dot text. (One big string.)
+
+    'class_graph' is an optional prebuilt (parent => children,
+    child => parents) pair from inheritance.class_graph, for callers
+    that have already derived it; otherwise we build it here -- once,
+    shared by the cluster and edge passes below.
     """
+    if class_graph is None:
+        class_graph = inheritance.class_graph(classes)
+    parent_to_children, child_to_parents = class_graph
+
     lines = [
         f"digraph {{",
         '  node [shape=box, fontname="Arial"];',
@@ -28,9 +40,9 @@ def hierarchy_diagram_dot(
         '  fontname = "Arial";',
     ]
     if group_by_module:
-        for lns in _clusters(classes, cls_color):
+        for lns in _clusters(classes, cls_color, child_to_parents):
             lines.extend(lns)
-    lines.extend(_edge_lines(classes, cls_color))
+    lines.extend(_edge_lines(classes, cls_color, parent_to_children))
     lines.append("}")
     return "\n".join(lines)
 
@@ -40,12 +52,25 @@ def hierarchy_diagram_dot(
 
 _CLASS_NAMES_TO_OMIT = frozenset("object Enum".split())
 
+# Constant line fragments, joined around the variable parts: on a big
+# graph, thousands of lines get built, and joining a few prebuilt
+# chunks beats re-interpolating them into every f-string.
+_NODE_PREFIX = "    "
+_NODE_SUFFIX = ";"
+_NODE_BROWN_SUFFIX = " [fontcolor=brown];"
+_EDGE_PREFIX = "  "
+_EDGE_MID = " -> { "
+_EDGE_SUFFIX = " };"
 
-def _edge_lines(classes: Set[type], cls_color: Callable[[type], str]) -> List[str]:
+
+def _edge_lines(
+    classes: Set[type],
+    cls_color: Callable[[type], str],
+    parent_to_children: Dict[type, List[type]],
+) -> List[str]:
     """ Add arrows from parents to children.
     Elide arrows from 'object' or 'Enum', as there are too many.
     """
-    parent_to_children = inheritance.parent_children_dict(classes)
 
     def mk_line(parent: type, children: List[type]):
         children_str = " ".join(_dot_safe_name(c) for c in children)
@@ -58,44 +83,52 @@ def _edge_lines(classes: Set[type], cls_color: Callable[[type], str]) -> List[st
         if parent not in classes:
             parent_name = f'"{parent_name}\n({parent.__module__})"'
 
-        return f"  {parent_name} -> {{ {children_str} }};"
+        return "".join(
+            (_EDGE_PREFIX, parent_name, _EDGE_MID, children_str, _EDGE_SUFFIX)
+        )
 
     def node_line(cls: type) -> str:
         clr = "" if cls_color is None else f" [fontcolor={cls_color(cls)}]"
-        return f"    {_dot_safe_name(cls)}{clr};"
-
-    edges = [
-        mk_line(p, cs)
-        for p, cs in parent_to_children.items()
-        if p.__name__ not in _CLASS_NAMES_TO_OMIT
-    ]
-    nodes = [
-        node_line(c)
-        for p, cs in parent_to_children.items()
-        if p.__name__ not in _CLASS_NAMES_TO_OMIT
-        for c in cs
-    ]
+        return "".join((_NODE_PREFIX, _dot_safe_name(cls), clr, _NODE_SUFFIX))
+
+    # One pass: the edge per parent, plus each child node (deduped --
+    # a class under several parents only needs one node line).
+    edges = []
+    children = {}  # insertion-ordered set
+    for p, cs in parent_to_children.items():
+        if p.__name__ in _CLASS_NAMES_TO_OMIT:
+            continue
+        edges.append(mk_line(p, cs))
+        for c in cs:
+            children[c] = None
+    nodes = [node_line(c) for c in children]
 
     return nodes + edges
 
 
 def _clusters(
-    classes: Set[type], cls_color: Callable[[type], str]
+    classes: Set[type],
+    cls_color: Callable[[type], str],
+    child_to_parents: Dict[type, List[type]],
 ) -> List[List[str]]:
     """ Make one cluster per module.
     The cluster contains only nodes. (No edges.)
     """
     # group classes by module
-    m2cs = {}
+    m2cs = collections.defaultdict(list)
     for c, m in pkg.class_module_dict(classes).items():
-        m2cs.setdefault(m, []).append(c)
+        m2cs[m].append(c)
 
-    # One cluster per module in package.
-    return [_one_cluster(m, cs, cls_color) for m, cs in m2cs.items()]
+    # One cluster per module in package. All share the one
+    # child => parents dict, rather than re-deriving it per module.
+    return [_one_cluster(m, cs, cls_color, child_to_parents) for m, cs in m2cs.items()]
 
 
 def _one_cluster(
-    module: ModuleType, classes: List[type], cls_color: Callable[[type], str]
+    module: ModuleType,
+    classes: List[type],
+    cls_color: Callable[[type], str],
+    child_to_parents: Dict[type, List[type]],
 ) -> List[str]:
     """ Create a cluster subgraph containing the 'classes' of 'module'.
     """
@@ -113,7 +146,6 @@ def _one_cluster(
         ]
     )
     # The nodes themselves - w/ logic for label text and color.
-    child_to_parents = inheritance.child_parents_dict(classes)
     for c in classes:
         lines.append(_node_line(c, child_to_parents, cls_color))
     # End of cluster.
@@ -131,16 +163,17 @@ def _node_line(
     # If it's a child of Enum, then make it brown.
     if cls in child_to_parents:
         if "Enum" in child_to_parents[cls]:
-            return f"    {_dot_safe_name(cls)} [fontcolor=brown];"
+            return "".join((_NODE_PREFIX, _dot_safe_name(cls), _NODE_BROWN_SUFFIX))
 
     # Not Enum
     clr = "" if cls_color is None else f" [fontcolor={cls_color(cls)}]"
-    return f"    {_dot_safe_name(cls)}{clr};"
+    return "".join((_NODE_PREFIX, _dot_safe_name(cls), clr, _NODE_SUFFIX))
 
 
 _DOT_KEYWORDS = frozenset("Digraph Graph SubgraphContext Dot".split())
 
 
+@functools.lru_cache(maxsize=None)
 def _dot_safe_name(cls: type) -> str:
     """If the name of the class is also a Dot-language keyword, then it
     must be wrapped in quotes (else cause a Dot parsing error).
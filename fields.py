@@ -3,8 +3,10 @@ objects.
 """
 
 import collections
+import functools
 import inspect
-from typing import Callable, Dict, List, Set
+import types
+from typing import Callable, Dict, Iterable, List, Set, Tuple
 from Groq.quid.composition import coltypes, hierarchy, mangler, objects
 
 
@@ -31,6 +33,9 @@ class TypeTracker:
         self._collection_types = coltypes.CollectionTypesInternTable(
             max_elements=max_elements
         )
+        # (class, field_name, type(val)) triples already recorded --
+        # scalars only, so a repeat observation can return immediately.
+        self._seen_scalar_fields: Set[Tuple[type, str, type]] = set()
 
     # --------------------------------------
     # viewing results - classes and fields
@@ -80,7 +85,7 @@ class TypeTracker:
         """
         if obj is not None:
             skip_name = _skip_name_predicate(obj)
-            for n, v in inspect.getmembers(obj, lambda v: not _is_function_like(v)):
+            for n, v in _data_members(obj):
                 if not skip_name(n):
                     self._observe_field(obj, n, v)
 
@@ -91,8 +96,18 @@ class TypeTracker:
         """For this object's field 'field_name',
         add val's type into the set seen for this field.
         """
-        if not type(val).__name__.startswith("sys."):
-            self._field_types[type(obj)][field_name].add(self._get_val_type(val))
+        val_type = type(val)
+        key = (type(obj), field_name, val_type)
+        if key in self._seen_scalar_fields:
+            return
+        if not val_type.__name__.startswith("sys."):
+            observed_type = self._get_val_type(val)
+            self._field_types[type(obj)][field_name].add(observed_type)
+            # For a scalar, _get_val_type is just type(val); collections
+            # get an interned class instead, and must be re-analyzed
+            # every time since their contents may differ.
+            if observed_type is val_type:
+                self._seen_scalar_fields.add(key)
 
     def _get_val_type(self, val) -> type:
         """If val's type is 'simple', just return it.
@@ -100,16 +115,39 @@ class TypeTracker:
         Python doesn't have types for, say, List[str], so we'll
         dynamically create classes as necessary and use those.
         """
-        if isinstance(val, coltypes.COLLECTION_TYPES):
+        val_type = type(val)
+        if val_type in coltypes.COLLECTION_TYPE_SET or isinstance(
+            val, coltypes.COLLECTION_TYPES
+        ):
             return self._collection_types.collection_type_for(val)
         else:
-            return type(val)
+            return val_type
 
 
 # -----------------
 # funcs
 
 
+def _data_members(obj) -> Iterable:
+    """The (name, value) pairs of obj's data: instance dict first,
+    then any class-level data attributes the instance doesn't shadow.
+
+    Reading the dicts directly sidesteps 'inspect.getmembers', which
+    sorts, getattr's every name in dir(), and so triggers the whole
+    descriptor protocol per attribute.
+    """
+    try:
+        inst = vars(obj)
+    except TypeError:
+        # e.g. __slots__-only instances have no __dict__.
+        return inspect.getmembers(obj, lambda v: not _is_function_like(v))
+    pairs = list(inst.items())
+    pairs.extend(
+        (k, v) for k, v in _class_data_members(type(obj)) if k not in inst
+    )
+    return pairs
+
+
 def _skip_name_predicate(obj: object) -> Callable[[str], bool]:
     """We use information about an object's type (class)
     to determine which of its fields we care about and which not.
@@ -117,8 +155,7 @@ def _skip_name_predicate(obj: object) -> Callable[[str], bool]:
     Specifically, which are function-like things?
     """
     # for properties & functions
-    cls = type(obj)
-    func_names = [k for k, v in inspect.getmembers(cls, _is_function_like)]
+    func_names = _func_like_names(type(obj))
 
     # In case we want to filter for only endemic data members.
     # endemic_funcs = [f for f in cls.__dict__.keys() if not f.startswith("__")]
@@ -127,13 +164,52 @@ def _skip_name_predicate(obj: object) -> Callable[[str], bool]:
     return lambda name: name.startswith("__") or name in func_names
 
 
+@functools.lru_cache(maxsize=None)
+def _class_data_members(cls: type) -> Tuple[Tuple[str, object], ...]:
+    """(name, value) pairs of cls's non-function class attributes.
+
+    First definition along the MRO wins, matching attribute lookup.
+    Depends only on the class, so computed once per class.
+    """
+    seen = set()
+    pairs = []
+    for c in cls.__mro__:
+        for k, v in vars(c).items():
+            if k in seen:
+                continue
+            seen.add(k)
+            if not _is_function_like(v):
+                pairs.append((k, v))
+    return tuple(pairs)
+
+
+@functools.lru_cache(maxsize=None)
+def _func_like_names(cls: type) -> frozenset:
+    """Names of all of cls's function-like attributes.
+
+    Walks the MRO and reads each class's own __dict__, rather than
+    getattr'ing through 'inspect.getmembers'. Depends only on the
+    class, so the walk happens once per class, not once per instance
+    observed.
+    """
+    return frozenset(
+        k for c in cls.__mro__ for k, v in vars(c).items() if _is_function_like(v)
+    )
+
+
+_FUNC_LIKE_TYPES = (
+    types.FunctionType,
+    types.MethodType,
+    types.BuiltinFunctionType,  # also covers builtin methods
+    types.MethodDescriptorType,
+    types.WrapperDescriptorType,
+    classmethod,
+    staticmethod,
+    property,
+)
+
+
 def _is_function_like(v) -> bool:
     """Keep function-like things. (Not data fields.)"""
-    return any(
-        (
-            inspect.isfunction(v),
-            inspect.ismethod(v),
-            inspect.isbuiltin(v),
-            isinstance(v, property),
-        )
-    )
+    # One C-level isinstance, vs. a Python-level inspect.is* call per kind.
+    return isinstance(v, _FUNC_LIKE_TYPES)
@@ -38,31 +38,42 @@ def _show_hierarchy(
     indent = 4 * " "
     lns = []
 
-    def from_node(cls: type, depth: int):
-        if cls in visited:
-            return
-        visited.add(cls)
-        lns.append(depth * indent + cls.__name__)
-
-        if cls in field_types:
-            max_name_len = max(len(name) for name in field_types[cls].keys())
-            for name, types in sorted(field_types[cls].items(), key=lambda p: p[0]):
-                # `types` is already a set, so there won't be duplicates.
-                s = "{pre}{name:{ln}} : {types_str}".format(
-                    pre=(depth + 1) * indent,
-                    name=name,
-                    ln=max_name_len,
-                    types_str=_type_signature_of_types(types, qualify_hint),
+    def from_node(root: type) -> None:
+        # Depth-first, with an explicit stack: no Python frame per
+        # class, no recursion limit to hit on deep hierarchies.
+        stack = [(root, 0)]
+        while stack:
+            cls, depth = stack.pop()
+            if cls in visited:
+                continue
+            visited.add(cls)
+            lns.append(depth * indent + cls.__name__)
+
+            if cls in field_types:
+                items = sorted(field_types[cls].items(), key=lambda p: p[0])
+                max_name_len = max(len(name) for name, _ in items)
+                for name, types in items:
+                    # `types` is already a set, so there won't be duplicates.
+                    s = "{pre}{name:{ln}} : {types_str}".format(
+                        pre=(depth + 1) * indent,
+                        name=name,
+                        ln=max_name_len,
+                        types_str=_type_signature_of_types(types, qualify_hint),
+                    )
+                    lns.append(s)
+
+            if cls in base_to_subs:
+                # Reverse-sorted, so the LIFO pop yields alpha order.
+                stack.extend(
+                    (child, depth + 1)
+                    for child in sorted(
+                        base_to_subs[cls], key=lambda c: c.__name__, reverse=True
+                    )
                 )
-                lns.append(s)
-
-        if cls in base_to_subs:
-            for child in sorted(base_to_subs[cls], key=lambda c: c.__name__):
-                from_node(child, depth + 1)
 
-    from_node(Enum, 0)
+    from_node(Enum)
     print()
-    from_node(object, 0)
+    from_node(object)
     return lns
 
 
@@ -71,15 +82,18 @@ def _base_to_subs(field_types: Dict[type, Dict[str, type]]) -> Dict[type, List[t
     Dict: base_class => child_classes.
     """
     d = collections.defaultdict(list)
+    visited = set()
 
-    def one_cls(cls: type) -> None:
-        if cls not in [object, Enum]:
-            for b in cls.__bases__:
-                d[b].append(cls)
-                one_cls(b)
-
-    for cls in field_types.keys():
-        one_cls(cls)
+    # Shared base chains only need ascending once, not once per leaf.
+    stack = list(field_types.keys())
+    while stack:
+        cls = stack.pop()
+        if cls in visited or cls in (object, Enum):
+            continue
+        visited.add(cls)
+        for b in cls.__bases__:
+            d[b].append(cls)
+            stack.append(b)
     return d
 
 
@@ -109,12 +123,15 @@ def _type_signature_of_types(
         return dm(next(iter(types)))
 
     # Use 'Option'?
+    # Work on a copy: 'types' is the tracker's live set, and removing
+    # from it here would un-record the None observation (the tracker's
+    # seen-field cache would then never re-add it).
     # pylint: disable=unidiomatic-typecheck
     opt = True
     if None in types:
-        types.remove(None)
+        types = types - {None}
     elif type(None) in types:
-        types.remove(type(None))
+        types = types - {type(None)}
     else:
         opt = False
 
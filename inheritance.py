@@ -1,7 +1,28 @@
 """ class inheritance: parents & children
 """
 
-from typing import Dict, List
+import collections
+from typing import Dict, List, Tuple
+
+
+def class_graph(
+    classes: List[type],
+) -> Tuple[Dict[type, List[type]], Dict[type, List[type]]]:
+    """
+    (parent => children, child => parents)
+
+    Both relations, from a single walk of the classes' __bases__ --
+    for callers that need both, or that pass the graph on to several
+    consumers.
+    """
+    parent_to_children = collections.defaultdict(list)
+    child_to_parents = {}
+    for child in classes:
+        parents = child.__bases__
+        child_to_parents[child] = parents
+        for parent in parents:
+            parent_to_children[parent].append(child)
+    return dict(parent_to_children), child_to_parents
 
 
 def child_parents_dict(classes: List[type]) -> Dict[type, List[type]]:
@@ -15,8 +36,9 @@ def parent_children_dict(classes: List[type]) -> Dict[type, List[type]]:
     """
     parent => children
     """
-    d = {}
+    d = collections.defaultdict(list)
     for child in classes:
         for parent in child.__bases__:
-            d.setdefault(parent, []).append(child)
-    return d
+            d[parent].append(child)
+    # Plain dict, so callers' lookups don't auto-insert.
+    return dict(d)
@@ -13,8 +13,9 @@ Then when displaying the names of classes, unmangle them.
 """
 
 import enum
+import functools
 import re
-from typing import Tuple, Pattern
+from typing import Tuple
 from Groq.quid.composition import ancestor
 
 
@@ -33,30 +34,38 @@ _SIMPLE_BUILTIN_TYPES = frozenset(
 )
 
 
-_DEMANGLE_SUBSTITUTIONS: Tuple[Tuple[Pattern[str], str]] = (
-    (re.compile("^frozenset_"), "FrozenSet_"),
-    (re.compile("_frozenset_"), "_FrozenSet_"),
-    (re.compile("^set_"), "Set_"),
-    (re.compile("_set_"), "_Set_"),
-    (re.compile("^tuple_"), "Tuple_"),
-    (re.compile("_tuple_"), "_Tuple_"),
-    (re.compile("^list_"), "List_"),
-    (re.compile("_list_"), "_List_"),
-    (re.compile("^defaultdict_"), "DefaultDict_"),
-    (re.compile("_defaultdict_"), "_DefaultDict_"),
-    (re.compile("^dict_"), "Dict_"),
-    (re.compile("_dict_"), "_Dict_"),
-    (re.compile("^function_"), "Callable_"),
-    (re.compile("_function_"), "_Callable_"),
-    (re.compile("_of_"), "["),
-    (re.compile("_fo_"), "]"),
-    (re.compile("_and_"), ", "),
+_DEMANGLE_WORD_SUBSTITUTIONS: Tuple[Tuple[str, str], ...] = (
+    ("^frozenset_", "FrozenSet_"),
+    ("_frozenset_", "_FrozenSet_"),
+    ("^set_", "Set_"),
+    ("_set_", "_Set_"),
+    ("^tuple_", "Tuple_"),
+    ("_tuple_", "_Tuple_"),
+    ("^list_", "List_"),
+    ("_list_", "_List_"),
+    ("^defaultdict_", "DefaultDict_"),
+    ("_defaultdict_", "_DefaultDict_"),
+    ("^dict_", "Dict_"),
+    ("_dict_", "_Dict_"),
+    ("^function_", "Callable_"),
+    ("_function_", "_Callable_"),
+)
+
+_DEMANGLE_PUNCT_SUBSTITUTIONS: Tuple[Tuple[str, str], ...] = (
+    ("_of_", "["),
+    ("_fo_", "]"),
+    ("_and_", ", "),
 )
 
 
+@functools.lru_cache(maxsize=None)
 def demangle(t: type, qualify_hint: HintModule) -> str:
     """Pretty-up the display of a single type, making it look like a mypy
     type hint.
+
+    Pure in its arguments, and called with the same types over and over
+    when rendering a hierarchy, so memoize. (Fanout is bounded:
+    #distinct-types x #HintModule-values.)
     """
     # None
     if t is type(None):
@@ -64,7 +73,7 @@ def demangle(t: type, qualify_hint: HintModule) -> str:
 
     # CollectionType
     elif ancestor.CollectionType in t.__bases__:
-        return _ordered_subs(t.__name__, _DEMANGLE_SUBSTITUTIONS)
+        return _ordered_subs(t.__name__, _DEMANGLE_PASSES)
 
     # builtins
     elif t.__name__ in _SIMPLE_BUILTIN_TYPES:
@@ -83,24 +92,27 @@ def demangle(t: type, qualify_hint: HintModule) -> str:
 # ----------------
 
 
-_MANGLE_SUBSTITUTIONS: Tuple[Tuple[Pattern[str], str]] = (
-    (re.compile(", "), "_and_"),
-    (re.compile("\]"), "_fo_"),
-    (re.compile("\["), "_of_"),
-    (re.compile("^Callable_"), "function_"),
-    (re.compile("_Callable_"), "_function_"),
-    (re.compile("^Dict_"), "dict_"),
-    (re.compile("_Dict_"), "_dict_"),
-    (re.compile("^DefaultDict_"), "defaultdict_"),
-    (re.compile("_DefaultDict_"), "_defaultdict_"),
-    (re.compile("^List_"), "list_"),
-    (re.compile("_List_"), "_list_"),
-    (re.compile("^Tuple_"), "tuple_"),
-    (re.compile("_Tuple_"), "_tuple_"),
-    (re.compile("^Set_"), "set_"),
-    (re.compile("_Set_"), "_set_"),
-    (re.compile("^FrozenSet_"), "frozenset_"),
-    (re.compile("_FrozenSet_"), "_frozenset_"),
+_MANGLE_PUNCT_SUBSTITUTIONS: Tuple[Tuple[str, str], ...] = (
+    (", ", "_and_"),
+    (r"\]", "_fo_"),
+    (r"\[", "_of_"),
+)
+
+_MANGLE_WORD_SUBSTITUTIONS: Tuple[Tuple[str, str], ...] = (
+    ("^Callable_", "function_"),
+    ("_Callable_", "_function_"),
+    ("^Dict_", "dict_"),
+    ("_Dict_", "_dict_"),
+    ("^DefaultDict_", "defaultdict_"),
+    ("_DefaultDict_", "_defaultdict_"),
+    ("^List_", "list_"),
+    ("_List_", "_list_"),
+    ("^Tuple_", "tuple_"),
+    ("_Tuple_", "_tuple_"),
+    ("^Set_", "set_"),
+    ("_Set_", "_set_"),
+    ("^FrozenSet_", "frozenset_"),
+    ("_FrozenSet_", "_frozenset_"),
 )
 
 
@@ -108,14 +120,42 @@ def mangle(hint: str) -> str:
     """ Given the desired name (type hint) for a class,
     return the actual name to give the class.
     """
-    return _ordered_subs(hint, _MANGLE_SUBSTITUTIONS)
+    return _ordered_subs(hint, _MANGLE_PASSES)
 
 
 # ----------------
 # private
 
 
-def _ordered_subs(s, pairs: Tuple[Tuple[Pattern[str], str]]) -> str:
-    for pat, rep in pairs:
-        s = re.sub(pat, rep, s)
+def _combine(pairs: Tuple[Tuple[str, str], ...]):
+    """Fuse an ordered chain of substitutions into one alternation regex
+    (plus the parallel tuple of replacements).
+
+    're' takes the first alternative that matches at each position, so
+    keeping longer patterns ahead of their substrings (e.g. 'frozenset_'
+    before 'set_') preserves the old one-sub-per-pattern behavior.
+    """
+    regex = re.compile("|".join(f"({pat})" for pat, _rep in pairs))
+    repls = tuple(rep for _pat, rep in pairs)
+    return regex, repls
+
+
+def _ordered_subs(s: str, passes) -> str:
+    for regex, repls in passes:
+        s = regex.sub(lambda m: repls[m.lastindex - 1], s)
     return s
+
+
+# The punctuation and word substitutions can't be fused with each other:
+# mangling must rewrite '[' to '_of_' before the word patterns can see
+# 'Dict_', and demangling must restore 'List_' before '_and_' consumes
+# the shared underscores.
+_DEMANGLE_PASSES = (
+    _combine(_DEMANGLE_WORD_SUBSTITUTIONS),
+    _combine(_DEMANGLE_PUNCT_SUBSTITUTIONS),
+)
+
+_MANGLE_PASSES = (
+    _combine(_MANGLE_PUNCT_SUBSTITUTIONS),
+    _combine(_MANGLE_WORD_SUBSTITUTIONS),
+)
@@ -1,4 +1,5 @@
 import inspect
+import types
 
 # from groq.instruction import instructions as ix
 # from groq.instruction.units import mem
@@ -7,12 +8,11 @@ from groq.instruction.units import mem_agt
 
 def keep(v) -> bool:
     """We're concerned only with data fields, not methods."""
-    # return True
-    return not any(
-        inspect.isfunction(v),
-        inspect.ismethod(v),
-        inspect.isbuiltin(v),
-        isinstance(v, property),
+    # One isinstance against a tuple, instead of four inspect.is* calls.
+    # (The old 'any(a, b, c, d)' would have raised TypeError anyway --
+    # 'any' takes one iterable, not varargs.)
+    return not isinstance(
+        v, (types.FunctionType, types.MethodType, types.BuiltinFunctionType, property)
     )
 
 
@@ -36,28 +36,35 @@ def inspect_class(cls: type) -> None:
     print(f"class: {cls}")
     pairs = inspect.getmembers(cls)  # , keep)
 
-    print("  neither function/property:")
+    # Classify in a single pass: one type dispatch per member, instead
+    # of re-testing every pair once per category below.
+    funcs, props, other = [], [], []
     for k, v in sorted(pairs, key=lambda p: p[0]):
-        if not k.startswith("__"):
-            if not (inspect.isfunction(v) or isinstance(v, property)):
-                print(f"    {k} :: {v}")
+        if k.startswith("__"):
+            continue
+        if inspect.isfunction(v):
+            funcs.append(k)
+        elif isinstance(v, property):
+            props.append(k)
+        else:
+            other.append((k, v))
+
+    print("  neither function/property:")
+    for k, v in other:
+        print(f"    {k} :: {v}")
 
     print("  -----------")
 
     print("  properties:")
-    for k, v in sorted(pairs, key=lambda p: p[0]):
-        if not k.startswith("__"):
-            if isinstance(v, property):
-                print(f"    {k}")
+    for k in props:
+        print(f"    {k}")
 
     print("  -----------")
 
     # pairs = cls.__dict__.items()
     print("  functions:")
-    for k, v in sorted(pairs, key=lambda p: p[0]):
-        if not k.startswith("__"):
-            if inspect.isfunction(v):
-                print(f"    {k}")
+    for k in funcs:
+        print(f"    {k}")
 
     print("")
     print("")
@@ -1,13 +1,16 @@
 """ For getting all live Python objects.
 """
 
-import collections
 import enum
 import gc
-from typing import Set
+from typing import Iterable, Set
 
 
-def get_all_objects(classes: Set[type] = None) -> list:
+def get_all_objects(
+    classes: Set[type] = None,
+    roots: Iterable = None,
+    collect: bool = False,
+) -> list:
     """Fetch all in-memory objects whose types are provided,
     not including the result list itself.
 
@@ -15,28 +18,43 @@ def get_all_objects(classes: Set[type] = None) -> list:
 
     Args:
         classes : The types of objects we want to fetch.
+        roots   : Seed objects. When given, only objects transitively
+                  reachable from them are visited -- typically orders
+                  of magnitude fewer than the whole heap.
+                  Default: every gc-tracked object.
+        collect : Run a garbage collection first, so dead cycles
+                  aren't swept. Default: False.
     """
-    queue = collections.deque(gc.get_objects())
+    if collect:
+        gc.collect()
+    # Visit order doesn't matter, so a plain list used as a LIFO stack
+    # beats deque.popleft's per-block housekeeping.
+    queue = gc.get_objects() if roots is None else list(roots)
     res_objs = []
     seen = set(map(id, [res_objs, queue]))
     seen.add(id(seen))
 
+    # Bind the hot-loop names once.
+    seen_add = seen.add
+    extend = queue.extend
+    get_referents = gc.get_referents
+
     # pylint: disable=unidiomatic-typecheck
 
     while queue:
-        o = queue.popleft()
-        if id(o) in seen:
+        o = queue.pop()
+        i = id(o)
+        if i in seen:
             continue
-        seen.add(id(o))
+        seen_add(i)
         if not classes or type(o) in classes:
             res_objs.append(o)
-        queue.extend(gc.get_referents(o))
+        extend(get_referents(o))
 
     return res_objs
 
 
 def is_enum(ty: type) -> bool:
-    if enum.Enum in ty.__bases__:
-        return True
-    else:
-        return any(is_enum(t) for t in ty.__bases__)
+    # C-level subclass check (with CPython's MRO caching), rather than
+    # re-implementing it by recursing through __bases__.
+    return isinstance(ty, type) and issubclass(ty, enum.Enum)
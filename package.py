@@ -4,13 +4,13 @@
 
 """
 
-import numpy
-
 from Groq import quid
 
 
 def numpy_package():
     print("\n-----------\n-- numpy\n")
+    import numpy
+
     modules = quid.modules_in_package(numpy, keep=["numpy"], skip=None)
 
     # this uses 'view'
@@ -19,6 +19,8 @@ def numpy_package():
 
 def numpy_inheritance():
     """Print the inheritance hierarchy for numpy."""
+    import numpy
+
     classes = quid.classes_in_package(numpy, keep=["numpy"])
     quid.print_class_hierarchy(classes)
 
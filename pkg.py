@@ -11,9 +11,11 @@ contents.
 
 """
 
-import importlib
+import functools
 import inspect
-from typing import Set, Dict, List, Optional
+import re
+import sys
+from typing import Callable, Set, Dict, List, Optional, Tuple
 from types import ModuleType
 
 
@@ -46,28 +48,36 @@ def modules_in_package(
 
     """
 
-    def keep_module(mod: ModuleType) -> bool:
-        def any_match(strs: List[str]) -> bool:
-            return any(map(lambda s: s in mod.__name__, strs))
-
-        good = keep is None or any_match(keep)
-        return good and (skip is None or not any_match(skip))
+    # Compile the substring tests once: a single C-level scan per
+    # module name, instead of a Python-level loop over keep/skip.
+    # Only None means "no filter": an empty list compiles to a
+    # never-matching pattern, as any() over zero substrings is False.
+    def search(subs: List[str]) -> Callable:
+        return re.compile("|".join(map(re.escape, subs)) if subs else r"(?!)").search
 
-    def go(mod: ModuleType, accum: Set[ModuleType]) -> set:
-        # get all modules
-        try:
-            name_mod_pairs = inspect.getmembers(mod, inspect.ismodule)
-        except ModuleNotFoundError:
-            name_mod_pairs = []
+    keep_search = search(keep) if keep is not None else None
+    skip_search = search(skip) if skip is not None else None
 
-        # filter them
-        mods = set(m for _name, m in name_mod_pairs if keep_module(m))
-        # recurse on novel ones
-        for m in mods - accum:
-            accum = go(m, accum | mods)
-        return accum
-
-    return go(root_module, set([root_module]))
+    def keep_module(mod: ModuleType) -> bool:
+        name = mod.__name__
+        good = keep_search is None or keep_search(name) is not None
+        return good and (skip_search is None or skip_search(name) is None)
+
+    # Iterative worklist, seen-set keyed on id() (skips __hash__/__eq__
+    # dispatch): linear in modules visited, with no per-step set copies
+    # the way the old recursive set-union version had.
+    seen_ids = {id(root_module)}
+    accum = {root_module}
+    stack = [root_module]
+    while stack:
+        mod = stack.pop()
+        for sub in _submodules_of(mod):
+            if id(sub) in seen_ids or not keep_module(sub):
+                continue
+            seen_ids.add(id(sub))
+            accum.add(sub)
+            stack.append(sub)
+    return accum
 
 
 # --------------------
@@ -89,22 +99,14 @@ def classes_in_package(
 
 def classes_in_modules(modules: Set[ModuleType]) -> Set[type]:
     """For provided modules, gather up all classes defined therein."""
-    out = set()
-    for m in modules:
-        out |= classes_in_module(m)
-    return out
+    # One bulk union, instead of growing (and rehashing into) the
+    # result set once per module.
+    return set().union(*(_classes_of(m) for m in modules))
 
 
 def classes_in_module(module: ModuleType) -> Set[type]:
     """All classes defined in the provided module."""
-    try:
-        return set(
-            obj
-            for _name, obj in inspect.getmembers(module, inspect.isclass)
-            if obj.__module__ == module.__name__
-        )
-    except ModuleNotFoundError:
-        return set()
+    return set(_classes_of(module))
 
 
 # -------------------------
@@ -113,7 +115,20 @@ def classes_in_module(module: ModuleType) -> Set[type]:
 
 def class_module_dict(classes: Set[type]) -> Dict[type, ModuleType]:
     """For any class, where was it defined?"""
-    return {c: importlib.import_module(c.__module__) for c in classes}
+    # One lookup per unique module name, not per class. A class's
+    # defining module is nearly always already imported, so probe
+    # sys.modules directly: no import-lock, no import machinery.
+    mods: Dict[str, ModuleType] = {}
+    for c in classes:
+        name = c.__module__
+        if name not in mods:
+            m = sys.modules.get(name)
+            if m is None:
+                import importlib
+
+                m = importlib.import_module(name)
+            mods[name] = m
+    return {c: mods[c.__module__] for c in classes}
 
 
 def module_classes_dict(modules: Set[ModuleType]) -> Dict[ModuleType, List[type]]:
@@ -123,3 +138,44 @@ def module_classes_dict(modules: Set[ModuleType]) -> Dict[ModuleType, List[type]
         for c in classes_in_module(m):
             d.setdefault(m, []).append(c)
     return d
+
+
+def cache_clear() -> None:
+    """Forget the memoized module scans.
+    (A module gains attributes as more of its package gets imported.)
+    """
+    _submodules_of.cache_clear()
+    _classes_of.cache_clear()
+
+
+# -------------------------
+# private
+
+# Both scans go through 'inspect.getmembers' (dir() + getattr), not a
+# plain __dict__ read: the getattr calls are what fire lazy-submodule
+# __getattr__ hooks (PEP 562), so they *discover* submodules a
+# __dict__ scan would miss. Cached, because a package walk revisits
+# the same modules over and over.
+
+
+@functools.lru_cache(maxsize=None)
+def _submodules_of(module: ModuleType) -> Tuple[ModuleType, ...]:
+    """The modules reachable as attributes of 'module'."""
+    try:
+        return tuple(m for _name, m in inspect.getmembers(module, inspect.ismodule))
+    except ModuleNotFoundError:
+        return ()
+
+
+@functools.lru_cache(maxsize=None)
+def _classes_of(module: ModuleType) -> Tuple[type, ...]:
+    """The classes defined in (not merely imported into) 'module'."""
+    name = module.__name__
+    try:
+        return tuple(
+            obj
+            for _n, obj in inspect.getmembers(module, inspect.isclass)
+            if obj.__module__ == name
+        )
+    except ModuleNotFoundError:
+        return ()
@@ -1,7 +1,8 @@
 """ For combining multiple covariant types w/ a single, narrower one.
 """
 
-from typing import List, Set, Optional
+import functools
+from typing import FrozenSet, Iterable, List, Optional
 from Groq.quid.composition import ancestor, coltypes
 
 
@@ -10,19 +11,33 @@ from Groq.quid.composition import ancestor, coltypes
 ## Otherwise, that's our new type.
 
 
-def unify_types(types: Set[type]) -> Set[type]:
+def unify_types(types: Iterable[type]) -> FrozenSet[type]:
     """Given a set of types that might be unifiable w/ some common ancestor,
     attempt to reduce that set to a common ancestor.
 
     Return either just the original set of types, or a singleton set
     with the unified type.
+
+    Pure in its input, and nested coltype schemas feed it the same type
+    sets over and over, so the work happens in a helper memoized on the
+    frozenset of types.
     """
     if not types:
         raise ValueError("'types' set should not be empty.")
+    return _unify_cached(frozenset(types))
+
 
-    nca = ancestor.nearest_common_ancestor(list(types))
+@functools.lru_cache(maxsize=4096)
+def _unify_cached(types: FrozenSet[type]) -> FrozenSet[type]:
+    # A singleton is already as unified as it gets.
+    if len(types) == 1:
+        return types
+    # The frozenset is already deduped, so fold the memoized pairwise
+    # lookup directly -- in effect a lazily-built LUB table -- rather
+    # than going through nearest_common_ancestor's list + dedup.
+    nca = functools.reduce(ancestor.nearest_ancestor_for_pair, types)
     if nca:
-        return {nca}
+        return frozenset((nca,))
     elif not all(map(lambda t: ancestor.CollectionType in t.__bases__, types)):
         # not all subclasses of CollectionType
         return types
@@ -30,7 +45,7 @@ def unify_types(types: Set[type]) -> Set[type]:
         return _all_collection_types(types)
 
 
-def _all_collection_types(types: Set[type]) -> Set[type]:
+def _all_collection_types(types: FrozenSet[type]) -> FrozenSet[type]:
     """They're all collection types. Maybe we can reduce them.  Need to be
     of the same type of collection (but w/ different element types).
     """
@@ -47,7 +62,7 @@ def _all_collection_types(types: Set[type]) -> Set[type]:
             return _multiple_non_tuples(col_type, types)
 
 
-def _multiple_tuples(col_type: type, types: Set[type]) -> Set[type]:
+def _multiple_tuples(col_type: type, types: FrozenSet[type]) -> FrozenSet[type]:
     """The .collection_type for each is 'tuple'.  That means each of
     'types' has a '.element_types': a _tuple_ of types.
     """
@@ -68,51 +83,75 @@ def _multiple_tuples(col_type: type, types: Set[type]) -> Set[type]:
     else:
         # They _are_ all the same shape.
         # We'll want to compare 1sts w/ 1sts, 2nds w/ 2nds...
+        # Transpose once, so each position's types sit in one tuple,
+        # instead of re-indexing every element tuple per position.
+        # (The shape check above matters: zip would silently truncate
+        # to the shortest tuple.)
+        # Bind the helpers once, outside the per-position loop.
+        filter_unknowns = _filter_out_unknowns
+        unify = unify_types
+        reduce = functools.reduce
+        pair = ancestor.nearest_ancestor_for_pair
+
         nearest_common_ancestors = []
-        for i in range(tuple_len):
-            common_pos_types = _filter_out_unknowns(t[i] for t in element_type_tuples)
-            common_pos_types = unify_types(common_pos_types)
-            nca = ancestor.nearest_common_ancestor(common_pos_types)
+        for common_pos_types in zip(*element_type_tuples):
+            common_pos_types = filter_unknowns(common_pos_types)
+            if not common_pos_types:
+                # All Unknown at this position; nothing to unify on.
+                return types
+            common_pos_types = unify(common_pos_types)
+            nca = reduce(pair, common_pos_types)
             if nca is None:
                 return types
             else:
                 nearest_common_ancestors.append(nca)
         # Here, we have a list of ncas. Create a tuple type for it.
         ncas_type_tuple = coltypes.mk_tuple_class(tuple(nearest_common_ancestors))
-        return {_mk_col_type(col_type, ncas_type_tuple)}
+        return frozenset((_mk_col_type(col_type, ncas_type_tuple),))
 
 
-def _weird_singleton_tuple(col_type: type, types: Set[type]) -> Set[type]:
+def _weird_singleton_tuple(col_type: type, types: FrozenSet[type]) -> FrozenSet[type]:
     """I don't know why there's this weird, singular example of a
     singleton tuple.
     """
     element_types = _filter_out_unknowns(t.element_type for t in types)
+    if not element_types:
+        return types
     element_types = unify_types(element_types)
     if len(element_types) == 1:
         elem_type = next(iter(element_types))
-        return {_mk_col_type(col_type, elem_type)}
+        return frozenset((_mk_col_type(col_type, elem_type),))
     else:
         return types
 
 
-def _multiple_non_tuples(col_type: type, types: Set[type]) -> Set[type]:
+def _multiple_non_tuples(col_type: type, types: FrozenSet[type]) -> FrozenSet[type]:
     """All the same collection type...
     Remove 'Unknown's from the element types.
     If there's >1 element type, we want to skip those.
     """
     element_types = _filter_out_unknowns(t.element_type for t in types)
+    if not element_types:
+        return types
     element_types = unify_types(element_types)
-    nca = ancestor.nearest_common_ancestor(element_types)
+    nca = functools.reduce(ancestor.nearest_ancestor_for_pair, element_types)
     if nca is None:
         return types
     else:
-        return {_mk_col_type(col_type, nca)}
+        return frozenset((_mk_col_type(col_type, nca),))
+
+
+# One table for the whole module: instantiating a fresh one per call
+# defeated interning, so repeated unifications minted duplicate classes
+# for the same (col_type, elem_type). The lru_cache short-circuits even
+# the table's work, and guarantees the *same* class object comes back,
+# which keeps downstream set/dict operations on these types cheap.
+_CTS = coltypes.CollectionTypesInternTable()
 
 
+@functools.lru_cache(maxsize=None)
 def _mk_col_type(col_type, elem_type) -> type:
-    cts = coltypes.CollectionTypesInternTable()
-    t = cts.mk_collection_type(col_type, elem_type)
-    return t
+    return _CTS.mk_collection_type(col_type, elem_type)
 
 
 # or perhaps just an iterable?
@@ -123,9 +162,6 @@ def _filter_out_unknowns(types: List[type]) -> List[type]:
 def _common_len(xs: list) -> Optional[int]:
     if not xs:
         raise ValueError("Must have at least one item to determine common length.")
-    return len(xs[0]) if _same_len(xs) else None
-
-
-def _same_len(xs: list) -> bool:
-    len0 = len(xs[0])
-    return all(len(x) == len0 for x in xs[1:])
+    # One pass, no xs[1:] slice; 'all' bails at the first mismatch.
+    first = len(xs[0])
+    return first if all(len(x) == first for x in xs) else None
@@ -2,9 +2,8 @@
 """
 
 import os
-import subprocess
 from types import ModuleType
-from typing import Callable, List, Dict, Set
+from typing import Callable, List, Dict, Set, Tuple
 from Groq.quid import dot, inheritance, pkg
 
 
@@ -14,6 +13,8 @@ def class_hierarchy_image(
     group_by_module: bool = True,
     cls_color: Callable[[type], str] = None,
     ranksep: float = 3.0,
+    class_graph: Tuple[Dict, Dict] = None,
+    keep_dot: bool = False,
 ) -> None:
     """Creates a class hierarchy diagram.
 
@@ -38,23 +39,38 @@ def class_hierarchy_image(
                               How much vertical distance to put between "ranks"
                               (rows) of nodes in the diagram.
 
+            class_graph     : Prebuilt (parent => children, child => parents)
+                              pair from inheritance.class_graph, if the caller
+                              already has one. Default: None (derive it here).
+
+            keep_dot        : Also write the intermediate .dot source to
+                              '<img_file_root>.dot'. Default: False.
+
     """
+    # Imported here so the text-only entry points don't pay for it.
+    import subprocess
+
     img_ext = "png"
     img_file_name = img_file_root + "." + img_ext
-    dot_file_name = img_file_root + ".dot"
 
-    # create dot file
+    # create dot source
     dot_str = dot.hierarchy_diagram_dot(
-        classes, group_by_module=group_by_module, cls_color=cls_color, ranksep=ranksep
+        classes,
+        group_by_module=group_by_module,
+        cls_color=cls_color,
+        ranksep=ranksep,
+        class_graph=class_graph,
     )
     _ensure_path(img_file_root)
-    with open(dot_file_name, "w") as f:
-        f.write(dot_str)
+    if keep_dot:
+        with open(img_file_root + ".dot", "w") as f:
+            f.write(dot_str)
 
-    # generate image
-    args = ["dot", f"-T{img_ext}", dot_file_name, "-o", img_file_name]
+    # generate image -- feed the source over stdin, so we don't write
+    # it to disk (it can be MBs) just for dot to read it back.
+    args = ["dot", f"-T{img_ext}", "-o", img_file_name]
     print(f"Running subprocess: `{' '.join(args)}` ...")
-    subprocess.run(args, check=False)
+    subprocess.run(args, input=dot_str.encode(), check=False)
     print(f"Generated file: {img_file_name}.")
 
 
@@ -67,32 +83,62 @@ def _ensure_path(path: str) -> None:
 # ------------------
 
 
-def print_class_hierarchy(classes: Set[type]) -> None:
+def print_class_hierarchy(
+    classes: Set[type],
+    class_graph: Tuple[Dict, Dict] = None,
+) -> None:
     """Print textual outline showing class inheritance.
 
     In the case of multple inheritance...
     Classes which inherit from >1 parent will appear >1 time.
 
     Args:
-        classes : Which classes to display.
-                  Can be obtained from functions in pkg.
+        classes     : Which classes to display.
+                      Can be obtained from functions in pkg.
+        class_graph : Prebuilt (parent => children, child => parents)
+                      pair from inheritance.class_graph, if the caller
+                      already has one. Default: None (derive it here).
     """
+    if class_graph is None:
+        class_graph = inheritance.class_graph(classes)
+    parent_to_children, child_to_parents = class_graph
+
+    # Read each class's __name__ once: the same class appears as a
+    # parent in one dict and a child in the other.
+    names = {c: c.__name__ for c in classes}
+    for p in parent_to_children:
+        if p not in names:
+            # Parents from outside 'classes' (e.g. object).
+            names[p] = p.__name__
+
     # Dicts with class names.
-    names_parent_to_children: Dict[str, List[str]] = _names_dict(
-        inheritance.parent_children_dict(classes)
-    )
-    names_child_to_parents: Dict[str, List[str]] = _names_dict(
-        inheritance.child_parents_dict(classes)
-    )
+    names_parent_to_children: Dict[str, List[str]] = {
+        names[k]: [names[v] for v in vs] for k, vs in parent_to_children.items()
+    }
+    names_child_to_parents: Dict[str, List[str]] = {
+        names[k]: [names[v] for v in vs] for k, vs in child_to_parents.items()
+    }
 
     displayed_children = set()
 
-    def show_children(p: type, depth: int) -> None:
+    def show_children(p: str, depth: int) -> None:
+        # Explicit-stack DFS: no Python frame per class, and no
+        # RecursionError on very tall hierarchies. Children are pushed
+        # reverse-sorted so the LIFO pop yields them in ascending order.
         displayed_children.add(p)
-        for c in sorted(names_parent_to_children.get(p, [])):
-            print(("    " * depth) + f"{c}")
+        stack = [
+            (c, depth)
+            for c in sorted(names_parent_to_children.get(p, []), reverse=True)
+        ]
+        while stack:
+            c, d = stack.pop()
+            print(("    " * d) + f"{c}")
             if c not in displayed_children:
-                show_children(c, depth + 1)
+                displayed_children.add(c)
+                stack.extend(
+                    (g, d + 1)
+                    for g in sorted(names_parent_to_children.get(c, []), reverse=True)
+                )
 
     for p in sorted(names_parent_to_children.keys()):
         if p not in names_child_to_parents:
@@ -100,11 +146,6 @@ def print_class_hierarchy(classes: Set[type]) -> None:
             show_children(p, 1)
 
 
-def _names_dict(d: Dict[type, List[type]]) -> Dict[str, List[str]]:
-    """Map over the dict, replacing each element w/ its name."""
-    return {k.__name__: [v.__name__ for v in vs] for k, vs in d.items()}
-
-
 # ------------------
 
 